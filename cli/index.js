@@ -5,14 +5,14 @@ const inquirer = require('inquirer')
 const chalk = require('chalk')
 const ora = require('ora')
 const { table } = require('table')
-const bcrypt = require('bcryptjs')
 const fs = require('fs')
 const path = require('path')
 
 const redis = require('../src/models/redis')
+const { INIT_FILE_PATH, readInitData, writeInitData } = require('../src/utils/initDataHelper')
 const apiKeyService = require('../src/services/apiKeyService')
-const claudeAccountService = require('../src/services/claudeAccountService')
-const bedrockAccountService = require('../src/services/bedrockAccountService')
+// claudeAccountService、bedrockAccountService（依赖 AWS SDK）和 bcryptjs 在用到的命令中按需加载，
+// 避免 --help、--version 等路径加载无关模块
 
 const program = new Command()
 
@@ -101,6 +101,8 @@ program
     const spinner = ora('正在获取系统状态...').start()
 
     try {
+      const claudeAccountService = require('../src/services/claudeAccountService')
+
       const [, apiKeys, accounts] = await Promise.all([
         redis.getSystemStats(),
         apiKeyService.getAllApiKeys(),
@@ -189,9 +191,8 @@ async function createInitialAdmin() {
   console.log(styles.title('\n🔐 创建初始管理员账户\n'))
 
   // 检查是否已存在 init.json
-  const initFilePath = path.join(__dirname, '..', 'data', 'init.json')
-  if (fs.existsSync(initFilePath)) {
-    const existingData = JSON.parse(fs.readFileSync(initFilePath, 'utf8'))
+  const existingData = readInitData()
+  if (existingData) {
     console.log(styles.warning('⚠️  检测到已存在管理员账户！'))
     console.log(`   用户名: ${existingData.adminUsername}`)
     console.log(`   创建时间: ${new Date(existingData.initializedAt).toLocaleString()}`)
@@ -245,16 +246,14 @@ async function createInitialAdmin() {
       updatedAt: new Date().toISOString()
     }
 
-    // 确保 data 目录存在
-    const dataDir = path.join(__dirname, '..', 'data')
-    if (!fs.existsSync(dataDir)) {
-      fs.mkdirSync(dataDir, { recursive: true })
-    }
+    // 确保 data 目录存在（recursive 模式下目录已存在不会报错）
+    fs.mkdirSync(path.dirname(INIT_FILE_PATH), { recursive: true })
 
-    // 写入文件
-    fs.writeFileSync(initFilePath, JSON.stringify(initData, null, 2))
+    // 写入文件（以 0600 权限原子替换，覆盖已有文件时同样生效）
+    writeInitData(initData)
 
     // 2. 再更新 Redis 缓存
+    const bcrypt = require('bcryptjs')
     const passwordHash = await bcrypt.hash(adminData.password, 12)
 
     const credentials = {
@@ -271,7 +270,7 @@ async function createInitialAdmin() {
     console.log(`${styles.success('✅')} 用户名: ${adminData.username}`)
     console.log(`${styles.success('✅')} 密码: ${adminData.password}`)
     console.log(`${styles.info('ℹ️')} 请妥善保管登录凭据`)
-    console.log(`${styles.info('ℹ️')} 凭据已保存到: ${initFilePath}`)
+    console.log(`${styles.info('ℹ️')} 凭据已保存到: ${INIT_FILE_PATH}`)
     console.log(`${styles.warning('⚠️')} 如果服务正在运行，请重启服务以加载新凭据`)
   } catch (error) {
     spinner.fail('创建管理员账户失败')
@@ -657,6 +656,7 @@ async function deleteApiKey() {
 // ☁️ Bedrock 账户管理函数
 
 async function listBedrockAccounts() {
+  const bedrockAccountService = require('../src/services/bedrockAccountService')
   const spinner = ora('正在获取 Bedrock 账户...').start()
 
   try {
@@ -696,6 +696,7 @@ async function listBedrockAccounts() {
 }
 
 async function createBedrockAccount() {
+  const bedrockAccountService = require('../src/services/bedrockAccountService')
   console.log(styles.title('\n➕ 创建 Bedrock 账户\n'))
 
   const questions = [
@@ -787,6 +788,7 @@ async function createBedrockAccount() {
 }
 
 async function testBedrockAccount() {
+  const bedrockAccountService = require('../src/services/bedrockAccountService')
   const spinner = ora('正在获取 Bedrock 账户...').start()
 
   try {
@@ -832,6 +834,7 @@ async function testBedrockAccount() {
 }
 
 async function toggleBedrockAccount() {
+  const bedrockAccountService = require('../src/services/bedrockAccountService')
   const spinner = ora('正在获取 Bedrock 账户...').start()
 
   try {
@@ -883,6 +886,7 @@ async function toggleBedrockAccount() {
 }
 
 async function editBedrockAccount() {
+  const bedrockAccountService = require('../src/services/bedrockAccountService')
   const spinner = ora('正在获取 Bedrock 账户...').start()
 
   try {
@@ -953,6 +957,7 @@ async function editBedrockAccount() {
 }
 
 async function deleteBedrockAccount() {
+  const bedrockAccountService = require('../src/services/bedrockAccountService')
   const spinner = ora('正在获取 Bedrock 账户...').start()
 
   try {
@@ -5,6 +5,7 @@ const chalk = require('chalk')
 const ora = require('ora')
 
 const config = require('../config/config')
+const { readInitData, writeInitData } = require('../src/utils/initDataHelper')
 
 async function setup() {
   console.log(chalk.blue.bold('\n🚀 Claude Relay Service 初始化设置\n'))
@@ -61,10 +62,7 @@ async function setup() {
       version: '1.0.0'
     }
 
-    fs.writeFileSync(
-      path.join(__dirname, '..', 'data', 'init.json'),
-      JSON.stringify(initData, null, 2)
-    )
+    writeInitData(initData)
 
     spinner.succeed('初始化设置完成')
 
@@ -103,9 +101,8 @@ async function setup() {
 
 // 检查是否已初始化
 function checkInitialized() {
-  const initFile = path.join(__dirname, '..', 'data', 'init.json')
-  if (fs.existsSync(initFile)) {
-    const initData = JSON.parse(fs.readFileSync(initFile, 'utf8'))
+  const initData = readInitData()
+  if (initData) {
     console.log(chalk.yellow('⚠️  服务已经初始化过了！'))
     console.log(`   初始化时间: ${new Date(initData.initializedAt).toLocaleString()}`)
     console.log(`   管理员用户名: ${initData.adminUsername}`)
@@ -11,6 +11,7 @@ const logger = require('./utils/logger')
 const redis = require('./models/redis')
 const pricingService = require('./services/pricingService')
 const cacheMonitor = require('./utils/cacheMonitor')
+const { readInitData } = require('./utils/initDataHelper')
 
 // Import routes
 const apiRoutes = require('./routes/api')
@@ -43,6 +44,38 @@ class Application {
   constructor() {
     this.app = express()
     this.server = null
+    this._appVersion = null
+  }
+
+  // 获取版本号：优先使用环境变量，其次VERSION文件，再次package.json，最后使用默认值
+  // 运行期间版本号不会变化，首次解析后缓存，避免每次健康检查都同步读取文件
+  getAppVersion() {
+    if (this._appVersion) {
+      return this._appVersion
+    }
+
+    let version = process.env.APP_VERSION || process.env.VERSION
+    if (!version) {
+      try {
+        const versionFile = path.join(__dirname, '..', 'VERSION')
+        if (fs.existsSync(versionFile)) {
+          version = fs.readFileSync(versionFile, 'utf8').trim()
+        }
+      } catch (error) {
+        // 忽略错误，继续尝试其他方式
+      }
+    }
+    if (!version) {
+      try {
+        const { version: pkgVersion } = require('../package.json')
+        version = pkgVersion
+      } catch (error) {
+        version = '1.0.0'
+      }
+    }
+
+    this._appVersion = version
+    return version
   }
 
   async initialize() {
@@ -299,26 +332,7 @@ class Application {
 
           const memory = process.memoryUsage()
 
-          // 获取版本号：优先使用环境变量，其次VERSION文件，再次package.json，最后使用默认值
-          let version = process.env.APP_VERSION || process.env.VERSION
-          if (!version) {
-            try {
-              const versionFile = path.join(__dirname, '..', 'VERSION')
-              if (fs.existsSync(versionFile)) {
-                version = fs.readFileSync(versionFile, 'utf8').trim()
-              }
-            } catch (error) {
-              // 忽略错误，继续尝试其他方式
-            }
-          }
-          if (!version) {
-            try {
-              const { version: pkgVersion } = require('../package.json')
-              version = pkgVersion
-            } catch (error) {
-              version = '1.0.0'
-            }
-          }
+          const version = this.getAppVersion()
 
           const health = {
             status: 'healthy',
@@ -390,16 +404,13 @@ class Application {
   // 🔧 初始化管理员凭据（总是从 init.json 加载，确保数据一致性）
   async initializeAdmin() {
     try {
-      const initFilePath = path.join(__dirname, '..', 'data', 'init.json')
-
-      if (!fs.existsSync(initFilePath)) {
+      // 从 init.json 读取管理员凭据（作为唯一真实数据源）
+      const initData = readInitData()
+      if (!initData) {
         logger.warn('⚠️ No admin credentials found. Please run npm run setup first.')
         return
       }
 
-      // 从 init.json 读取管理员凭据（作为唯一真实数据源）
-      const initData = JSON.parse(fs.readFileSync(initFilePath, 'utf8'))
-
       // 将明文密码哈希化
       const saltRounds = 10
       const passwordHash = await bcrypt.hash(initData.adminPassword, saltRounds)
@@ -670,6 +681,15 @@ class Application {
             logger.error('❌ Error stopping cost rank service:', error)
           }
 
+          // 关闭 OAuth 请求复用的 Keep-Alive 连接
+          try {
+            const oauthHelper = require('./utils/oauthHelper')
+            oauthHelper.destroyAgents()
+            logger.info('🔐 OAuth keep-alive agent closed')
+          } catch (error) {
+            logger.error('❌ Error closing OAuth keep-alive agent:', error)
+          }
+
           // 🔢 清理所有并发计数（Phase 1 修复：防止重启泄漏）
           try {
             logger.info('🔢 Cleaning up all concurrency counters...')
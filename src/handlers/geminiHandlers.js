@@ -449,8 +449,9 @@ async function handleMessages(req, res) {
 
       // 添加代理配置
       if (proxyConfig) {
-        axiosConfig.httpsAgent = ProxyHelper.createProxyAgent(proxyConfig)
-        axiosConfig.httpAgent = ProxyHelper.createProxyAgent(proxyConfig)
+        const proxyAgent = ProxyHelper.createProxyAgent(proxyConfig)
+        axiosConfig.httpsAgent = proxyAgent
+        axiosConfig.httpAgent = proxyAgent
       }
 
       try {
@@ -731,8 +732,9 @@ async function handleModels(req, res) {
           headers: { 'Content-Type': 'application/json' }
         }
         if (proxyConfig) {
-          axiosConfig.httpsAgent = ProxyHelper.createProxyAgent(proxyConfig)
-          axiosConfig.httpAgent = ProxyHelper.createProxyAgent(proxyConfig)
+          const proxyAgent = ProxyHelper.createProxyAgent(proxyConfig)
+          axiosConfig.httpsAgent = proxyAgent
+          axiosConfig.httpAgent = proxyAgent
         }
         const response = await axios(axiosConfig)
         models = (response.data.models || []).map((m) => ({
@@ -1232,8 +1234,9 @@ async function handleCountTokens(req, res) {
       }
 
       if (proxyConfig) {
-        axiosConfig.httpsAgent = ProxyHelper.createProxyAgent(proxyConfig)
-        axiosConfig.httpAgent = ProxyHelper.createProxyAgent(proxyConfig)
+        const proxyAgent = ProxyHelper.createProxyAgent(proxyConfig)
+        axiosConfig.httpsAgent = proxyAgent
+        axiosConfig.httpAgent = proxyAgent
       }
 
       try {
@@ -1960,8 +1963,9 @@ async function handleStandardGenerateContent(req, res) {
       }
 
       if (proxyConfig) {
-        axiosConfig.httpsAgent = ProxyHelper.createProxyAgent(proxyConfig)
-        axiosConfig.httpAgent = ProxyHelper.createProxyAgent(proxyConfig)
+        const proxyAgent = ProxyHelper.createProxyAgent(proxyConfig)
+        axiosConfig.httpsAgent = proxyAgent
+        axiosConfig.httpAgent = proxyAgent
       }
 
       try {
@@ -2242,8 +2246,9 @@ async function handleStandardStreamGenerateContent(req, res) {
       }
 
       if (proxyConfig) {
-        axiosConfig.httpsAgent = ProxyHelper.createProxyAgent(proxyConfig)
-        axiosConfig.httpAgent = ProxyHelper.createProxyAgent(proxyConfig)
+        const proxyAgent = ProxyHelper.createProxyAgent(proxyConfig)
+        axiosConfig.httpsAgent = proxyAgent
+        axiosConfig.httpAgent = proxyAgent
       }
 
       try {
@@ -4,6 +4,7 @@
  */
 
 const express = require('express')
+const crypto = require('crypto')
 const router = express.Router()
 
 const claudeAccountService = require('../../services/claudeAccountService')
@@ -22,10 +23,10 @@ const { formatAccountExpiry, mapExpiryField } = require('./utils')
 router.post('/claude-accounts/generate-auth-url', authenticateAdmin, async (req, res) => {
   try {
     const { proxy } = req.body // 接收代理配置
-    const oauthParams = await oauthHelper.generateOAuthParams()
+    const oauthParams = oauthHelper.generateOAuthParams()
 
     // 将codeVerifier和state临时存储到Redis，用于后续验证
-    const sessionId = require('crypto').randomUUID()
+    const sessionId = crypto.randomUUID()
     await redis.setOAuthSession(sessionId, {
       codeVerifier: oauthParams.codeVerifier,
       state: oauthParams.state,
@@ -137,10 +138,10 @@ router.post('/claude-accounts/exchange-code', authenticateAdmin, async (req, res
 router.post('/claude-accounts/generate-setup-token-url', authenticateAdmin, async (req, res) => {
   try {
     const { proxy } = req.body // 接收代理配置
-    const setupTokenParams = await oauthHelper.generateSetupTokenParams()
+    const setupTokenParams = oauthHelper.generateSetupTokenParams()
 
     // 将codeVerifier和state临时存储到Redis，用于后续验证
-    const sessionId = require('crypto').randomUUID()
+    const sessionId = crypto.randomUUID()
     await redis.setOAuthSession(sessionId, {
       type: 'setup-token', // 标记为setup-token类型
       codeVerifier: setupTokenParams.codeVerifier,
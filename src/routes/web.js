@@ -2,10 +2,10 @@ const express = require('express')
 const bcrypt = require('bcryptjs')
 const crypto = require('crypto')
 const path = require('path')
-const fs = require('fs')
 const redis = require('../models/redis')
 const logger = require('../utils/logger')
 const config = require('../../config/config')
+const { readInitData, writeInitData } = require('../utils/initDataHelper')
 
 const router = express.Router()
 
@@ -34,34 +34,32 @@ router.post('/auth/login', async (req, res) => {
 
     // 如果Redis中没有管理员凭据，尝试从init.json重新加载
     if (!adminData || Object.keys(adminData).length === 0) {
-      const initFilePath = path.join(__dirname, '../../data/init.json')
-
-      if (fs.existsSync(initFilePath)) {
-        try {
-          const initData = JSON.parse(fs.readFileSync(initFilePath, 'utf8'))
-          const saltRounds = 10
-          const passwordHash = await bcrypt.hash(initData.adminPassword, saltRounds)
-
-          adminData = {
-            username: initData.adminUsername,
-            passwordHash,
-            createdAt: initData.initializedAt || new Date().toISOString(),
-            lastLogin: null,
-            updatedAt: initData.updatedAt || null
-          }
-
-          // 重新存储到Redis，不设置过期时间
-          await redis.getClient().hset('session:admin_credentials', adminData)
-
-          logger.info('✅ Admin credentials reloaded from init.json')
-        } catch (error) {
-          logger.error('❌ Failed to reload admin credentials:', error)
+      try {
+        const initData = readInitData()
+        if (!initData) {
           return res.status(401).json({
             error: 'Invalid credentials',
             message: 'Invalid username or password'
           })
         }
-      } else {
+
+        const saltRounds = 10
+        const passwordHash = await bcrypt.hash(initData.adminPassword, saltRounds)
+
+        adminData = {
+          username: initData.adminUsername,
+          passwordHash,
+          createdAt: initData.initializedAt || new Date().toISOString(),
+          lastLogin: null,
+          updatedAt: initData.updatedAt || null
+        }
+
+        // 重新存储到Redis，不设置过期时间
+        await redis.getClient().hset('session:admin_credentials', adminData)
+
+        logger.info('✅ Admin credentials reloaded from init.json')
+      } catch (error) {
+        logger.error('❌ Failed to reload admin credentials:', error)
         return res.status(401).json({
           error: 'Invalid credentials',
           message: 'Invalid username or password'
@@ -195,25 +193,30 @@ router.post('/auth/change-password', async (req, res) => {
       newUsername && newUsername.trim() ? newUsername.trim() : adminData.username
 
     // 先更新 init.json（唯一真实数据源）
-    const initFilePath = path.join(__dirname, '../../data/init.json')
-    if (!fs.existsSync(initFilePath)) {
-      return res.status(500).json({
-        error: 'Configuration file not found',
-        message: 'init.json file is missing'
-      })
-    }
-
     try {
-      const initData = JSON.parse(fs.readFileSync(initFilePath, 'utf8'))
+      const initData = readInitData()
+      if (!initData) {
+        return res.status(500).json({
+          error: 'Configuration file not found',
+          message: 'init.json file is missing'
+        })
+      }
+
       // const oldData = { ...initData }; // 备份旧数据
 
-      // 更新 init.json
-      initData.adminUsername = updatedUsername
-      initData.adminPassword = newPassword // 保存明文密码到init.json
-      initData.updatedAt = new Date().toISOString()
+      // 凭据未变化时无需重写文件
+      const credentialsChanged =
+        initData.adminUsername !== updatedUsername || initData.adminPassword !== newPassword
+
+      if (credentialsChanged) {
+        // 更新 init.json
+        initData.adminUsername = updatedUsername
+        initData.adminPassword = newPassword // 保存明文密码到init.json
+        initData.updatedAt = new Date().toISOString()
 
-      // 先写入文件（如果失败则不会影响 Redis）
-      fs.writeFileSync(initFilePath, JSON.stringify(initData, null, 2))
+        // 先写入文件（如果失败则不会影响 Redis）
+        writeInitData(initData)
+      }
 
       // 文件写入成功后，更新 Redis 缓存
       const saltRounds = 10
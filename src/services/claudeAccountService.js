@@ -6,6 +6,7 @@ const redis = require('../models/redis')
 const config = require('../../config/config')
 const logger = require('../utils/logger')
 const { maskToken } = require('../utils/tokenMask')
+const oauthHelper = require('../utils/oauthHelper')
 const {
   logRefreshStart,
   logRefreshSuccess,
@@ -172,19 +173,30 @@ class ClaudeAccountService {
       }
     }
 
+    // 如果有 OAuth 数据和 accessToken，且包含 user:profile 权限（标准 OAuth 有，Setup Token 没有），
+    // 在写入 Redis 的同时发起 profile 请求，避免两次串行等待
+    const hasProfileScope =
+      !!claudeAiOauth?.accessToken &&
+      !!claudeAiOauth.scopes &&
+      claudeAiOauth.scopes.includes('user:profile')
+    const profileAgent = hasProfileScope ? this._createProxyAgent(proxy) : null
+    const profileRequest = hasProfileScope
+      ? this._startProfileRequest(claudeAiOauth.accessToken, profileAgent)
+      : null
+
     await redis.setClaudeAccount(accountId, accountData)
 
     logger.success(`🏢 Created Claude account: ${name} (${accountId})`)
 
-    // 如果有 OAuth 数据和 accessToken，且包含 user:profile 权限，尝试获取 profile 信息
     if (claudeAiOauth && claudeAiOauth.accessToken) {
-      // 检查是否有 user:profile 权限（标准 OAuth 有，Setup Token 没有）
-      const hasProfileScope = claudeAiOauth.scopes && claudeAiOauth.scopes.includes('user:profile')
-
       if (hasProfileScope) {
         try {
-          const agent = this._createProxyAgent(proxy)
-          await this.fetchAndUpdateAccountProfile(accountId, claudeAiOauth.accessToken, agent)
+          await this.fetchAndUpdateAccountProfile(
+            accountId,
+            claudeAiOauth.accessToken,
+            profileAgent,
+            profileRequest
+          )
           logger.info(`📊 Successfully fetched profile info for new account: ${name}`)
         } catch (profileError) {
           logger.warn(`⚠️ Failed to fetch profile info for new account: ${profileError.message}`)
@@ -283,11 +295,8 @@ class ClaudeAccountService {
         timeout: 30000
       }
 
-      if (agent) {
-        axiosConfig.httpAgent = agent
-        axiosConfig.httpsAgent = agent
-        axiosConfig.proxy = false
-      }
+      // 使用与后续 profile 请求相同的 Agent（两者请求不同主机，不共享连接）
+      oauthHelper.applyRequestAgent(axiosConfig, agent)
 
       const response = await axios.post(
         this.claudeApiUrl,
@@ -341,15 +350,20 @@ class ClaudeAccountService {
         accountData.status = 'active'
         accountData.errorMessage = ''
 
-        await redis.setClaudeAccount(accountId, accountData)
-
         // 刷新成功后，如果有 user:profile 权限，尝试获取账号 profile 信息
         // 检查账户的 scopes 是否包含 user:profile（标准 OAuth 有，Setup Token 没有）
         const hasProfileScope = accountData.scopes && accountData.scopes.includes('user:profile')
 
+        // profile 请求与 Redis 写入并发进行，失败时仅记录警告，不影响刷新结果
+        const profileRequest = hasProfileScope
+          ? this._startProfileRequest(access_token, agent)
+          : null
+
+        await redis.setClaudeAccount(accountId, accountData)
+
         if (hasProfileScope) {
           try {
-            await this.fetchAndUpdateAccountProfile(accountId, access_token, agent)
+            await this.fetchAndUpdateAccountProfile(accountId, access_token, agent, profileRequest)
           } catch (profileError) {
             logger.warn(`⚠️ Failed to fetch profile info after refresh: ${profileError.message}`)
           }
@@ -2039,8 +2053,40 @@ class ClaudeAccountService {
     }
   }
 
+  // 📊 请求 Profile 接口（不读写账户数据，便于与其他操作并发执行）
+  async _requestAccountProfile(accessToken, agent = null) {
+    const axiosConfig = {
+      headers: {
+        Authorization: `Bearer ${accessToken}`,
+        'Content-Type': 'application/json',
+        Accept: 'application/json',
+        'User-Agent': 'claude-cli/1.0.56 (external, cli)',
+        'Accept-Language': 'en-US,en;q=0.9'
+      },
+      timeout: 15000
+    }
+
+    oauthHelper.applyRequestAgent(axiosConfig, agent)
+
+    return axios.get('https://api.anthropic.com/api/oauth/profile', axiosConfig)
+  }
+
+  // 📊 提前发起 Profile 请求，供 fetchAndUpdateAccountProfile 使用
+  // 错误在 fetchAndUpdateAccountProfile 中统一处理，这里仅防止未处理的 rejection
+  _startProfileRequest(accessToken, agent = null) {
+    const profileRequest = this._requestAccountProfile(accessToken, agent)
+    profileRequest.catch(() => {})
+    return profileRequest
+  }
+
   // 📊 获取账号 Profile 信息并更新账号类型
-  async fetchAndUpdateAccountProfile(accountId, accessToken = null, agent = null) {
+  // profileRequest: 可选，已提前发起的 _requestAccountProfile 请求
+  async fetchAndUpdateAccountProfile(
+    accountId,
+    accessToken = null,
+    agent = null,
+    profileRequest = null
+  ) {
     try {
       const accountData = await redis.getClaudeAccount(accountId)
       if (!accountData || Object.keys(accountData).length === 0) {
@@ -2071,25 +2117,8 @@ class ClaudeAccountService {
 
       logger.info(`📊 Fetching profile info for account: ${accountData.name} (${accountId})`)
 
-      // 请求 profile 接口
-      const axiosConfig = {
-        headers: {
-          Authorization: `Bearer ${accessToken}`,
-          'Content-Type': 'application/json',
-          Accept: 'application/json',
-          'User-Agent': 'claude-cli/1.0.56 (external, cli)',
-          'Accept-Language': 'en-US,en;q=0.9'
-        },
-        timeout: 15000
-      }
-
-      if (agent) {
-        axiosConfig.httpAgent = agent
-        axiosConfig.httpsAgent = agent
-        axiosConfig.proxy = false
-      }
-
-      const response = await axios.get('https://api.anthropic.com/api/oauth/profile', axiosConfig)
+      // 请求 profile 接口（复用已发起的请求）
+      const response = await (profileRequest || this._requestAccountProfile(accessToken, agent))
 
       if (response.status === 200 && response.data) {
         const profileData = response.data
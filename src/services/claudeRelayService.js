@@ -1,7 +1,5 @@
 const https = require('https')
 const zlib = require('zlib')
-const fs = require('fs')
-const path = require('path')
 const ProxyHelper = require('../utils/proxyHelper')
 const { filterForClaude } = require('../utils/headerFilter')
 const claudeAccountService = require('./claudeAccountService')
@@ -15,6 +13,7 @@ const ClaudeCodeValidator = require('../validators/clients/claudeCodeValidator')
 const { formatDateWithTimezone } = require('../utils/dateHelper')
 const requestIdentityService = require('./requestIdentityService')
 const { createClaudeTestPayload } = require('../utils/testPayloadHelper')
+const pricingService = require('./pricingService')
 
 class ClaudeRelayService {
   constructor() {
@@ -679,15 +678,13 @@ class ClaudeRelayService {
     }
 
     try {
-      // 读取模型定价配置文件
-      const pricingFilePath = path.join(__dirname, '../../data/model_pricing.json')
-
-      if (!fs.existsSync(pricingFilePath)) {
-        logger.warn('⚠️ Model pricing file not found, skipping max_tokens validation')
+      // 使用价格服务已加载的定价数据（由其负责启动加载、下载更新和文件变化重载）
+      const { pricingData } = pricingService
+      if (!pricingData) {
+        logger.warn('⚠️ Model pricing data not loaded, skipping max_tokens validation')
         return
       }
 
-      const pricingData = JSON.parse(fs.readFileSync(pricingFilePath, 'utf8'))
       const model = body.model || 'claude-sonnet-4-20250514'
 
       // 查找对应模型的配置
@@ -1059,7 +1056,6 @@ class ClaudeRelayService {
       }
 
       req.on('error', async (error) => {
-        console.error(': ❌ ', error)
         logger.error(`❌ Claude API request error (Account: ${accountId}):`, error.message, {
           code: error.code,
           errno: error.errno,
@@ -1465,7 +1461,6 @@ class ClaudeRelayService {
           })
 
           res.on('end', () => {
-            console.error(': ❌ ', errorData)
             logger.error(
               `❌ Claude API error response (Account: ${account?.name || accountId}):`,
               errorData
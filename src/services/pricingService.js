@@ -290,9 +290,18 @@ class PricingService {
             const rawContent = buffer.toString('utf8')
             const jsonData = JSON.parse(rawContent)
 
-            // 保存到文件并更新哈希
-            fs.writeFileSync(this.pricingFile, rawContent)
-            this.persistLocalHash(buffer)
+            // 内容与本地文件一致时只刷新修改时间（needsUpdate 依赖 mtime 判断文件新旧），
+            // 不再重写整个价格文件和哈希文件
+            const hash = crypto.createHash('sha256').update(buffer).digest('hex')
+            if (hash === this.computeLocalHash()) {
+              const now = new Date()
+              fs.utimesSync(this.pricingFile, now, now)
+              logger.debug('💰 Downloaded pricing data is unchanged, skipped file write')
+            } else {
+              // 保存到文件并更新哈希
+              fs.writeFileSync(this.pricingFile, rawContent)
+              fs.writeFileSync(this.localHashFile, `${hash}\n`)
+            }
 
             // 更新内存中的数据
             this.pricingData = jsonData
@@ -7,28 +7,24 @@ const config = require('../../config/config')
  * @returns {string} 格式化后的时间字符串
  */
 function formatDateWithTimezone(date, includeTimezone = true) {
-  // 处理不同类型的输入
-  let dateObj
+  // 处理不同类型的输入，统一转换为毫秒时间戳
+  let timestamp
   if (typeof date === 'number') {
     // 判断是秒还是毫秒时间戳
     // Unix时间戳（秒）通常小于 10^10，毫秒时间戳通常大于 10^12
-    if (date < 10000000000) {
-      dateObj = new Date(date * 1000) // 秒转毫秒
-    } else {
-      dateObj = new Date(date) // 已经是毫秒
-    }
+    timestamp = date < 10000000000 ? date * 1000 : date
   } else if (date instanceof Date) {
-    dateObj = date
+    timestamp = date.getTime()
   } else {
-    dateObj = new Date(date)
+    timestamp = new Date(date).getTime()
   }
 
   // 获取配置的时区偏移（小时）
   const timezoneOffset = config.system.timezoneOffset || 8 // 默认 UTC+8
 
-  // 计算本地时间
+  // 计算本地时间（只创建一个 Date 对象）
   const offsetMs = timezoneOffset * 3600000 // 转换为毫秒
-  const localTime = new Date(dateObj.getTime() + offsetMs)
+  const localTime = new Date(timestamp + offsetMs)
 
   // 格式化为 YYYY-MM-DD HH:mm:ss
   const year = localTime.getUTCFullYear()
@@ -79,18 +75,23 @@ function getISOStringWithTimezone(date) {
 function formatDuration(seconds) {
   if (seconds < 60) {
     return `${seconds}秒`
-  } else if (seconds < 3600) {
-    const minutes = Math.floor(seconds / 60)
-    return `${minutes}分钟`
-  } else if (seconds < 86400) {
-    const hours = Math.floor(seconds / 3600)
-    const minutes = Math.floor((seconds % 3600) / 60)
-    return minutes > 0 ? `${hours}小时${minutes}分钟` : `${hours}小时`
-  } else {
-    const days = Math.floor(seconds / 86400)
-    const hours = Math.floor((seconds % 86400) / 3600)
-    return hours > 0 ? `${days}天${hours}小时` : `${days}天`
   }
+
+  // 逐级整除，每个单位只计算一次
+  const totalMinutes = Math.floor(seconds / 60)
+  if (seconds < 3600) {
+    return `${totalMinutes}分钟`
+  }
+
+  const totalHours = Math.floor(totalMinutes / 60)
+  if (seconds < 86400) {
+    const minutes = totalMinutes % 60
+    return minutes > 0 ? `${totalHours}小时${minutes}分钟` : `${totalHours}小时`
+  }
+
+  const days = Math.floor(totalHours / 24)
+  const hours = totalHours % 24
+  return hours > 0 ? `${days}天${hours}小时` : `${days}天`
 }
 
 module.exports = {
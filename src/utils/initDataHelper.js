@@ -0,0 +1,54 @@
+/**
+ * init.json 读写工具
+ * init.json 保存管理员明文凭据，是管理员账户的唯一真实数据源；
+ * 服务、CLI 与 setup 脚本统一通过这里读写，保证写入方式一致
+ */
+
+const fs = require('fs')
+const path = require('path')
+
+// 管理员凭据文件路径，模块加载时解析一次
+const INIT_FILE_PATH = path.join(__dirname, '../../data/init.json')
+
+/**
+ * 读取 init.json
+ * 直接读取文件并处理 ENOENT，省去额外的 existsSync 检查
+ * @returns {object|null} 解析后的数据，文件不存在时返回 null
+ */
+function readInitData() {
+  let raw
+  try {
+    raw = fs.readFileSync(INIT_FILE_PATH, 'utf8')
+  } catch (error) {
+    if (error.code === 'ENOENT') {
+      return null
+    }
+    throw error
+  }
+  return JSON.parse(raw)
+}
+
+/**
+ * 写入 init.json
+ * 先完整写入临时文件再原子替换，避免写入中断导致凭据文件损坏；
+ * 临时文件总是以 0600 权限新建，替换后 init.json 不会沿用旧文件的权限
+ * @param {object} initData - 要写入的数据
+ */
+function writeInitData(initData) {
+  const tmpPath = `${INIT_FILE_PATH}.tmp`
+  // mode 只在新建文件时生效：先清理上次失败残留的临时文件，再以 wx 独占新建
+  fs.rmSync(tmpPath, { force: true })
+  try {
+    fs.writeFileSync(tmpPath, JSON.stringify(initData, null, 2), { mode: 0o600, flag: 'wx' })
+    fs.renameSync(tmpPath, INIT_FILE_PATH)
+  } catch (error) {
+    fs.rmSync(tmpPath, { force: true })
+    throw error
+  }
+}
+
+module.exports = {
+  INIT_FILE_PATH,
+  readInitData,
+  writeInitData
+}
@@ -4,26 +4,45 @@
  */
 
 const crypto = require('crypto')
+const https = require('https')
+const tls = require('tls')
 const ProxyHelper = require('./proxyHelper')
 const axios = require('axios')
 const logger = require('./logger')
 
-// OAuth 配置常量 - 从claude-code-login.js提取
-const OAUTH_CONFIG = {
+// OAuth 配置常量 - 从claude-code-login.js提取（冻结，防止调用方意外修改共享配置）
+const OAUTH_CONFIG = Object.freeze({
   AUTHORIZE_URL: 'https://claude.ai/oauth/authorize',
   TOKEN_URL: 'https://console.anthropic.com/v1/oauth/token',
   CLIENT_ID: '9d1c250a-e61b-44d9-88ed-5944d1962f5e',
   REDIRECT_URI: 'https://console.anthropic.com/oauth/code/callback',
   SCOPES: 'org:create_api_key user:profile user:inference',
   SCOPES_SETUP: 'user:inference' // Setup Token 只需要推理权限
-}
+})
 
 // Cookie自动授权配置常量
-const COOKIE_OAUTH_CONFIG = {
+const COOKIE_OAUTH_CONFIG = Object.freeze({
   CLAUDE_AI_URL: 'https://claude.ai',
   ORGANIZATIONS_URL: 'https://claude.ai/api/organizations',
   AUTHORIZE_URL_TEMPLATE: 'https://claude.ai/v1/oauth/{organization_uuid}/authorize'
-}
+})
+
+// 授权码格式：Claude的授权码通常是base64url格式，只包含字母、数字、下划线、连字符
+const AUTH_CODE_PATTERN = /^[A-Za-z0-9_-]+$/
+
+// 可安全重试的连接级错误：请求尚未到达服务器，重试不会导致授权码被重复使用
+const RETRYABLE_CONNECTION_ERRORS = new Set([
+  'ECONNREFUSED',
+  'EAI_AGAIN',
+  'EHOSTUNREACH',
+  'ENETUNREACH'
+])
+
+// 直连（无代理）时复用的 Keep-Alive Agent，懒加载
+// 避免 token 交换、组织查询、Cookie 授权等连续请求每次都重新进行 TCP/TLS 握手
+// 注：axios 的 Node 适配器只支持 HTTP/1.1，且 token 与 profile 接口不在同一主机，
+// 因此采用 Keep-Alive + TLS 会话复用（https.Agent 默认缓存会话）而非 HTTP/2 多路复用
+let directAgent = null
 
 /**
  * 生成随机的 state 参数
@@ -50,6 +69,23 @@ function generateCodeChallenge(codeVerifier) {
   return crypto.createHash('sha256').update(codeVerifier).digest('base64url')
 }
 
+/**
+ * 一次性生成 PKCE 相关参数
+ * 只读取一次随机源（64 字节），前 32 字节作为 code verifier，后 32 字节作为 state
+ * @returns {{state: string, codeVerifier: string, codeChallenge: string}}
+ */
+function generatePkceParams() {
+  const raw = crypto.randomBytes(64)
+  const codeVerifier = raw.subarray(0, 32).toString('base64url')
+  const state = raw.subarray(32).toString('base64url')
+
+  return {
+    state,
+    codeVerifier,
+    codeChallenge: generateCodeChallenge(codeVerifier)
+  }
+}
+
 /**
  * 生成授权 URL
  * @param {string} codeChallenge - PKCE code challenge
@@ -76,9 +112,7 @@ function generateAuthUrl(codeChallenge, state) {
  * @returns {{authUrl: string, codeVerifier: string, state: string, codeChallenge: string}}
  */
 function generateOAuthParams() {
-  const state = generateState()
-  const codeVerifier = generateCodeVerifier()
-  const codeChallenge = generateCodeChallenge(codeVerifier)
+  const { state, codeVerifier, codeChallenge } = generatePkceParams()
 
   const authUrl = generateAuthUrl(codeChallenge, state)
 
@@ -116,9 +150,7 @@ function generateSetupTokenAuthUrl(codeChallenge, state) {
  * @returns {{authUrl: string, codeVerifier: string, state: string, codeChallenge: string}}
  */
 function generateSetupTokenParams() {
-  const state = generateState()
-  const codeVerifier = generateCodeVerifier()
-  const codeChallenge = generateCodeChallenge(codeVerifier)
+  const { state, codeVerifier, codeChallenge } = generatePkceParams()
 
   const authUrl = generateSetupTokenAuthUrl(codeChallenge, state)
 
@@ -130,6 +162,15 @@ function generateSetupTokenParams() {
   }
 }
 
+/**
+ * 清理授权码，移除URL片段和后续参数
+ * @param {string} code - 原始授权码
+ * @returns {string} 清理后的授权码
+ */
+function cleanAuthorizationCode(code) {
+  return code.split('#', 1)[0].split('&', 1)[0]
+}
+
 /**
  * 创建代理agent（使用统一的代理工具）
  * @param {object|null} proxyConfig - 代理配置对象
@@ -139,6 +180,114 @@ function createProxyAgent(proxyConfig) {
   return ProxyHelper.createProxyAgent(proxyConfig)
 }
 
+/**
+ * 获取直连复用的 Keep-Alive Agent（懒加载）
+ * @returns {https.Agent} 共享的 HTTPS Agent
+ */
+function getDirectAgent() {
+  if (!directAgent) {
+    directAgent = new https.Agent({
+      keepAlive: true,
+      maxSockets: 100,
+      maxFreeSockets: 20,
+      // 共享同一个 TLS 上下文，避免每个新连接都重新创建（加载 CA 证书）
+      secureContext: tls.createSecureContext()
+    })
+  }
+  return directAgent
+}
+
+/**
+ * 为 axios 请求配置注入连接 Agent
+ * 代理 Agent 已由 ProxyHelper 按配置缓存，直连时使用共享的 Keep-Alive Agent
+ * @param {object} axiosConfig - axios 请求配置
+ * @param {object|null} agent - 代理 agent
+ * @returns {object} 注入 Agent 后的 axios 请求配置
+ */
+function applyRequestAgent(axiosConfig, agent) {
+  if (agent) {
+    axiosConfig.httpAgent = agent
+    axiosConfig.httpsAgent = agent
+    axiosConfig.proxy = false
+  } else {
+    axiosConfig.httpsAgent = getDirectAgent()
+  }
+  return axiosConfig
+}
+
+/**
+ * 关闭直连 Agent 中保持的空闲连接（用于优雅关闭）
+ */
+function destroyAgents() {
+  if (directAgent) {
+    directAgent.destroy()
+    directAgent = null
+  }
+}
+
+/**
+ * 判断错误是否为可安全重试的连接级错误
+ * @param {Error} error - axios 错误
+ * @returns {boolean} 是否可重试
+ */
+function isRetryableConnectionError(error) {
+  if (error.response) {
+    return false
+  }
+  if (RETRYABLE_CONNECTION_ERRORS.has(error.code)) {
+    return true
+  }
+  // 复用的 Keep-Alive 空闲连接可能已被对端关闭，此时请求并未被处理
+  return error.code === 'ECONNRESET' && error.request?.reusedSocket === true
+}
+
+/**
+ * 执行 OAuth 请求，遇到连接级瞬时错误时按指数退避重试
+ * @param {Function} fn - 发起请求的函数
+ * @param {number} maxRetries - 最大重试次数
+ * @param {number} baseDelay - 初始退避时间（毫秒）
+ * @returns {Promise<object>} axios 响应
+ */
+async function requestWithRetry(fn, maxRetries = 3, baseDelay = 200) {
+  for (let attempt = 0; attempt <= maxRetries; attempt++) {
+    try {
+      return await fn()
+    } catch (error) {
+      if (attempt === maxRetries || !isRetryableConnectionError(error)) {
+        throw error
+      }
+
+      const delay = baseDelay * Math.pow(2, attempt) // 指数退避
+      logger.debug(
+        `🔄 OAuth request connection error (${error.code}), retry ${attempt + 1}/${maxRetries} in ${delay}ms`
+      )
+      await new Promise((resolve) => setTimeout(resolve, delay))
+    }
+  }
+}
+
+/**
+ * 从 OAuth 错误响应中提取错误信息
+ * 直接使用 axios 已解析的响应体，不再重复解析
+ * @param {number} status - HTTP 状态码
+ * @param {object|string} errorData - 错误响应体
+ * @returns {string} 错误信息
+ */
+function formatOAuthErrorMessage(status, errorData) {
+  if (!errorData) {
+    return `HTTP ${status}`
+  }
+  if (typeof errorData === 'string') {
+    return `HTTP ${status}: ${errorData}`
+  }
+  if (errorData.error) {
+    return errorData.error_description
+      ? `HTTP ${status}: ${errorData.error} - ${errorData.error_description}`
+      : `HTTP ${status}: ${errorData.error}`
+  }
+  return `HTTP ${status}: ${JSON.stringify(errorData)}`
+}
+
 /**
  * 使用授权码交换访问令牌
  * @param {string} authorizationCode - 授权码
@@ -149,7 +298,7 @@ function createProxyAgent(proxyConfig) {
  */
 async function exchangeCodeForTokens(authorizationCode, codeVerifier, state, proxyConfig = null) {
   // 清理授权码，移除URL片段
-  const cleanedCode = authorizationCode.split('#')[0]?.split('&')[0] ?? authorizationCode
+  const cleanedCode = cleanAuthorizationCode(authorizationCode)
 
   const params = {
     grant_type: 'authorization_code',
@@ -192,13 +341,11 @@ async function exchangeCodeForTokens(authorizationCode, codeVerifier, state, pro
       timeout: 30000
     }
 
-    if (agent) {
-      axiosConfig.httpAgent = agent
-      axiosConfig.httpsAgent = agent
-      axiosConfig.proxy = false
-    }
+    applyRequestAgent(axiosConfig, agent)
 
-    const response = await axios.post(OAUTH_CONFIG.TOKEN_URL, params, axiosConfig)
+    const response = await requestWithRetry(() =>
+      axios.post(OAUTH_CONFIG.TOKEN_URL, params, axiosConfig)
+    )
 
     // 记录完整的响应数据到专门的认证详细日志
     logger.authDetail('OAuth token exchange response', response.data)
@@ -235,7 +382,7 @@ async function exchangeCodeForTokens(authorizationCode, codeVerifier, state, pro
     const result = {
       accessToken: data.access_token,
       refreshToken: data.refresh_token,
-      expiresAt: (Math.floor(Date.now() / 1000) + data.expires_in) * 1000,
+      expiresAt: Date.now() + data.expires_in * 1000,
       scopes: data.scope ? data.scope.split(' ') : ['user:inference', 'user:profile'],
       isMax: true,
       organization: organizationInfo,
@@ -273,23 +420,7 @@ async function exchangeCodeForTokens(authorizationCode, codeVerifier, state, pro
         codePrefix: `${cleanedCode.substring(0, 10)}...`
       })
 
-      // 尝试从错误响应中提取有用信息
-      let errorMessage = `HTTP ${status}`
-
-      if (errorData) {
-        if (typeof errorData === 'string') {
-          errorMessage += `: ${errorData}`
-        } else if (errorData.error) {
-          errorMessage += `: ${errorData.error}`
-          if (errorData.error_description) {
-            errorMessage += ` - ${errorData.error_description}`
-          }
-        } else {
-          errorMessage += `: ${JSON.stringify(errorData)}`
-        }
-      }
-
-      throw new Error(`Token exchange failed: ${errorMessage}`)
+      throw new Error(`Token exchange failed: ${formatOAuthErrorMessage(status, errorData)}`)
     } else if (error.request) {
       // 请求被发送但没有收到响应
       logger.error('❌ OAuth token exchange failed with network error', {
@@ -309,6 +440,31 @@ async function exchangeCodeForTokens(authorizationCode, codeVerifier, state, pro
   }
 }
 
+/**
+ * 从回调 URL 的查询字符串中提取 code 参数
+ * 只扫描查询字符串，无需构造完整的 URL 对象和参数表
+ * @param {string} url - 回调 URL
+ * @returns {string|null} 授权码，未找到时返回null
+ * @throws {URIError} code 参数的编码无效时抛出
+ */
+function extractCodeFromUrl(url) {
+  const queryStart = url.indexOf('?')
+  if (queryStart === -1) {
+    return null
+  }
+
+  const hashStart = url.indexOf('#', queryStart)
+  const query = url.slice(queryStart + 1, hashStart === -1 ? undefined : hashStart)
+
+  for (const part of query.split('&')) {
+    if (part.startsWith('code=')) {
+      return decodeURIComponent(part.slice(5).replace(/\+/g, ' '))
+    }
+  }
+
+  return null
+}
+
 /**
  * 解析回调 URL 或授权码
  * @param {string} input - 完整的回调 URL 或直接的授权码
@@ -323,26 +479,23 @@ function parseCallbackUrl(input) {
 
   // 情况1: 尝试作为完整URL解析
   if (trimmedInput.startsWith('http://') || trimmedInput.startsWith('https://')) {
+    let authorizationCode
     try {
-      const urlObj = new URL(trimmedInput)
-      const authorizationCode = urlObj.searchParams.get('code')
-
-      if (!authorizationCode) {
-        throw new Error('回调 URL 中未找到授权码 (code 参数)')
-      }
-
-      return authorizationCode
+      authorizationCode = extractCodeFromUrl(trimmedInput)
     } catch (error) {
-      if (error.message.includes('回调 URL 中未找到授权码')) {
-        throw error
-      }
       throw new Error('无效的 URL 格式，请检查回调 URL 是否正确')
     }
+
+    if (!authorizationCode) {
+      throw new Error('回调 URL 中未找到授权码 (code 参数)')
+    }
+
+    return authorizationCode
   }
 
   // 情况2: 直接的授权码（可能包含URL fragments）
   // 参考claude-code-login.js的处理方式：移除URL fragments和参数
-  const cleanedCode = trimmedInput.split('#')[0]?.split('&')[0] ?? trimmedInput
+  const cleanedCode = cleanAuthorizationCode(trimmedInput)
 
   // 验证授权码格式（Claude的授权码通常是base64url格式）
   if (!cleanedCode || cleanedCode.length < 10) {
@@ -350,8 +503,7 @@ function parseCallbackUrl(input) {
   }
 
   // 基本格式验证：授权码应该只包含字母、数字、下划线、连字符
-  const validCodePattern = /^[A-Za-z0-9_-]+$/
-  if (!validCodePattern.test(cleanedCode)) {
+  if (!AUTH_CODE_PATTERN.test(cleanedCode)) {
     throw new Error('授权码包含无效字符，请检查是否复制了正确的 Authorization Code')
   }
 
@@ -368,7 +520,7 @@ function parseCallbackUrl(input) {
  */
 async function exchangeSetupTokenCode(authorizationCode, codeVerifier, state, proxyConfig = null) {
   // 清理授权码，移除URL片段
-  const cleanedCode = authorizationCode.split('#')[0]?.split('&')[0] ?? authorizationCode
+  const cleanedCode = cleanAuthorizationCode(authorizationCode)
 
   const params = {
     grant_type: 'authorization_code',
@@ -412,13 +564,11 @@ async function exchangeSetupTokenCode(authorizationCode, codeVerifier, state, pr
       timeout: 30000
     }
 
-    if (agent) {
-      axiosConfig.httpAgent = agent
-      axiosConfig.httpsAgent = agent
-      axiosConfig.proxy = false
-    }
+    applyRequestAgent(axiosConfig, agent)
 
-    const response = await axios.post(OAUTH_CONFIG.TOKEN_URL, params, axiosConfig)
+    const response = await requestWithRetry(() =>
+      axios.post(OAUTH_CONFIG.TOKEN_URL, params, axiosConfig)
+    )
 
     // 记录完整的响应数据到专门的认证详细日志
     logger.authDetail('Setup Token exchange response', response.data)
@@ -454,7 +604,7 @@ async function exchangeSetupTokenCode(authorizationCode, codeVerifier, state, pr
     const result = {
       accessToken: data.access_token,
       refreshToken: '',
-      expiresAt: (Math.floor(Date.now() / 1000) + data.expires_in) * 1000,
+      expiresAt: Date.now() + data.expires_in * 1000,
       scopes: data.scope ? data.scope.split(' ') : ['user:inference', 'user:profile'],
       isMax: true,
       organization: organizationInfo,
@@ -490,21 +640,7 @@ async function exchangeSetupTokenCode(authorizationCode, codeVerifier, state, pr
         codePrefix: `${cleanedCode.substring(0, 10)}...`
       })
 
-      let errorMessage = `HTTP ${status}`
-      if (errorData) {
-        if (typeof errorData === 'string') {
-          errorMessage += `: ${errorData}`
-        } else if (errorData.error) {
-          errorMessage += `: ${errorData.error}`
-          if (errorData.error_description) {
-            errorMessage += ` - ${errorData.error_description}`
-          }
-        } else {
-          errorMessage += `: ${JSON.stringify(errorData)}`
-        }
-      }
-
-      throw new Error(`Setup Token exchange failed: ${errorMessage}`)
+      throw new Error(`Setup Token exchange failed: ${formatOAuthErrorMessage(status, errorData)}`)
     } else if (error.request) {
       logger.error('❌ Setup Token exchange failed with network error', {
         message: error.message,
@@ -625,13 +761,11 @@ async function getOrganizationInfo(sessionKey, proxyConfig = null) {
       maxRedirects: 0 // 禁止自动重定向，以便检测Cloudflare拦截(302)
     }
 
-    if (agent) {
-      axiosConfig.httpAgent = agent
-      axiosConfig.httpsAgent = agent
-      axiosConfig.proxy = false
-    }
+    applyRequestAgent(axiosConfig, agent)
 
-    const response = await axios.get(COOKIE_OAUTH_CONFIG.ORGANIZATIONS_URL, axiosConfig)
+    const response = await requestWithRetry(() =>
+      axios.get(COOKIE_OAUTH_CONFIG.ORGANIZATIONS_URL, axiosConfig)
+    )
 
     if (!response.data || !Array.isArray(response.data)) {
       throw new Error('获取组织信息失败：响应格式无效')
@@ -700,9 +834,7 @@ async function getOrganizationInfo(sessionKey, proxyConfig = null) {
  */
 async function authorizeWithCookie(sessionKey, organizationUuid, scope, proxyConfig = null) {
   // 生成PKCE参数
-  const codeVerifier = generateCodeVerifier()
-  const codeChallenge = generateCodeChallenge(codeVerifier)
-  const state = generateState()
+  const { state, codeVerifier, codeChallenge } = generatePkceParams()
 
   // 构建授权URL
   const authorizeUrl = COOKIE_OAUTH_CONFIG.AUTHORIZE_URL_TEMPLATE.replace(
@@ -748,13 +880,9 @@ async function authorizeWithCookie(sessionKey, organizationUuid, scope, proxyCon
       maxRedirects: 0 // 禁止自动重定向，以便检测Cloudflare拦截(302)
     }
 
-    if (agent) {
-      axiosConfig.httpAgent = agent
-      axiosConfig.httpsAgent = agent
-      axiosConfig.proxy = false
-    }
+    applyRequestAgent(axiosConfig, agent)
 
-    const response = await axios.post(authorizeUrl, payload, axiosConfig)
+    const response = await requestWithRetry(() => axios.post(authorizeUrl, payload, axiosConfig))
 
     // 从响应中获取redirect_uri
     const redirectUri = response.data?.redirect_uri
@@ -880,9 +1008,13 @@ module.exports = {
   generateState,
   generateCodeVerifier,
   generateCodeChallenge,
+  generatePkceParams,
   generateAuthUrl,
   generateSetupTokenAuthUrl,
   createProxyAgent,
+  getDirectAgent,
+  applyRequestAgent,
+  destroyAgents,
   // Cookie自动授权相关方法
   buildCookieHeaders,
   getOrganizationInfo,
@@ -1,8 +1,27 @@
 const { SocksProxyAgent } = require('socks-proxy-agent')
 const { HttpsProxyAgent } = require('https-proxy-agent')
 const logger = require('./logger')
+const LRUCache = require('./lruCache')
 const config = require('../../config/config')
 
+// 支持的代理类型及其对应的 URL scheme（SOCKS5 使用 socks5h 以便由代理解析 DNS）
+const PROXY_URL_SCHEMES = new Map([
+  ['socks5', 'socks5h'],
+  ['http', 'http'],
+  ['https', 'https']
+])
+
+// 有效代理端口范围
+const PROXY_PORT_MIN = 1
+const PROXY_PORT_MAX = 65535
+
+// 日志描述中的固定文案
+const NO_PROXY_DESCRIPTION = 'No proxy'
+const INVALID_PROXY_DESCRIPTION = 'Invalid proxy config'
+
+// 密码脱敏时最多显示的星号
+const PASSWORD_MASK = '********'
+
 /**
  * 统一的代理创建工具
  * 支持 SOCKS5 和 HTTP/HTTPS 代理，可配置 IPv4/IPv6
@@ -10,6 +29,12 @@ const config = require('../../config/config')
 class ProxyHelper {
   // 缓存代理 Agent，避免重复创建浪费连接
   static _agentCache = new Map()
+  static _agentCommonOptions = null
+
+  // 缓存已解析的代理字段、脱敏信息与描述，相同代理配置无需重复解析与拼接
+  static _proxyFieldsCache = new LRUCache(500)
+  static _maskedInfoCache = new LRUCache(500)
+  static _descriptionCache = new LRUCache(500)
 
   /**
    * 创建代理 Agent
@@ -24,11 +49,9 @@ class ProxyHelper {
     }
 
     try {
-      // 解析代理配置
-      const proxy = typeof proxyConfig === 'string' ? JSON.parse(proxyConfig) : proxyConfig
-
-      // 验证必要字段
-      if (!proxy.type || !proxy.host || !proxy.port) {
+      // 解析代理配置并验证必要字段
+      const proxy = ProxyHelper._validatedFields(proxyConfig)
+      if (!proxy) {
         logger.warn('⚠️ Invalid proxy configuration: missing required fields (type, host, port)')
         return null
       }
@@ -36,90 +59,37 @@ class ProxyHelper {
       // 获取 IPv4/IPv6 配置
       const useIPv4 = ProxyHelper._getIPFamilyPreference(options.useIPv4)
 
-      // 配置连接池与 Keep-Alive
-      const proxySettings = config.proxy || {}
-      const agentCommonOptions = {}
-
-      if (typeof proxySettings.keepAlive === 'boolean') {
-        agentCommonOptions.keepAlive = proxySettings.keepAlive
-      }
-
-      if (
-        typeof proxySettings.maxSockets === 'number' &&
-        Number.isFinite(proxySettings.maxSockets) &&
-        proxySettings.maxSockets > 0
-      ) {
-        agentCommonOptions.maxSockets = proxySettings.maxSockets
-      }
-
-      if (
-        typeof proxySettings.maxFreeSockets === 'number' &&
-        Number.isFinite(proxySettings.maxFreeSockets) &&
-        proxySettings.maxFreeSockets >= 0
-      ) {
-        agentCommonOptions.maxFreeSockets = proxySettings.maxFreeSockets
-      }
-
-      if (
-        typeof proxySettings.timeout === 'number' &&
-        Number.isFinite(proxySettings.timeout) &&
-        proxySettings.timeout > 0
-      ) {
-        agentCommonOptions.timeout = proxySettings.timeout
-      }
-
-      // 缓存键：保证相同配置的代理可复用
-      const cacheKey = JSON.stringify({
-        type: proxy.type,
-        host: proxy.host,
-        port: proxy.port,
-        username: proxy.username,
-        password: proxy.password,
-        family: useIPv4,
-        keepAlive: agentCommonOptions.keepAlive,
-        maxSockets: agentCommonOptions.maxSockets,
-        maxFreeSockets: agentCommonOptions.maxFreeSockets,
-        timeout: agentCommonOptions.timeout
-      })
+      // 缓存键：保证相同配置的代理可复用（连接池选项来自静态配置，进程内不变，无需计入）
+      const { type, host, port, username, password } = proxy
+      const cacheKey = JSON.stringify([type, host, port, username, password, useIPv4])
 
       if (ProxyHelper._agentCache.has(cacheKey)) {
         return ProxyHelper._agentCache.get(cacheKey)
       }
 
-      // 构建认证信息
-      const auth = proxy.username && proxy.password ? `${proxy.username}:${proxy.password}@` : ''
-      let agent = null
-
-      // 根据代理类型创建 Agent
-      if (proxy.type === 'socks5') {
-        const socksUrl = `socks5h://${auth}${proxy.host}:${proxy.port}`
-        const socksOptions = { ...agentCommonOptions }
-
-        // 设置 IP 协议族（如果指定）
-        if (useIPv4 !== null) {
-          socksOptions.family = useIPv4 ? 4 : 6
-        }
-
-        agent = new SocksProxyAgent(socksUrl, socksOptions)
-      } else if (proxy.type === 'http' || proxy.type === 'https') {
-        const proxyUrl = `${proxy.type}://${auth}${proxy.host}:${proxy.port}`
-        const httpOptions = { ...agentCommonOptions }
-
-        // HttpsProxyAgent 支持 family 参数（通过底层的 agent-base）
-        if (useIPv4 !== null) {
-          httpOptions.family = useIPv4 ? 4 : 6
-        }
-
-        agent = new HttpsProxyAgent(proxyUrl, httpOptions)
-      } else {
+      // 构建代理 URL（仅在 Agent 缓存未命中时执行，每种代理配置只构建一次）
+      const proxyUrl = ProxyHelper._formatProxyUrl(proxy)
+      if (!proxyUrl) {
         logger.warn(`⚠️ Unsupported proxy type: ${proxy.type}`)
         return null
       }
 
-      if (agent) {
-        ProxyHelper._agentCache.set(cacheKey, agent)
+      const agentOptions = { ...ProxyHelper._getAgentCommonOptions() }
+
+      // 设置 IP 协议族（如果指定）
+      // HttpsProxyAgent 支持 family 参数（通过底层的 agent-base）
+      if (useIPv4 !== null) {
+        agentOptions.family = useIPv4 ? 4 : 6
       }
 
+      // 根据代理类型创建 Agent
+      const agent =
+        proxy.type === 'socks5'
+          ? new SocksProxyAgent(proxyUrl, agentOptions)
+          : new HttpsProxyAgent(proxyUrl, agentOptions)
+
+      ProxyHelper._agentCache.set(cacheKey, agent)
+
       return agent
     } catch (error) {
       logger.warn('⚠️ Failed to create proxy agent:', error.message)
@@ -127,6 +97,125 @@ class ProxyHelper {
     }
   }
 
+  /**
+   * 获取连接池与 Keep-Alive 选项（来自静态配置，首次调用时计算）
+   * @returns {object} Agent 公共选项
+   * @private
+   */
+  static _getAgentCommonOptions() {
+    if (ProxyHelper._agentCommonOptions) {
+      return ProxyHelper._agentCommonOptions
+    }
+
+    const proxySettings = config.proxy || {}
+    const agentCommonOptions = {}
+
+    if (typeof proxySettings.keepAlive === 'boolean') {
+      agentCommonOptions.keepAlive = proxySettings.keepAlive
+    }
+
+    if (
+      typeof proxySettings.maxSockets === 'number' &&
+      Number.isFinite(proxySettings.maxSockets) &&
+      proxySettings.maxSockets > 0
+    ) {
+      agentCommonOptions.maxSockets = proxySettings.maxSockets
+    }
+
+    if (
+      typeof proxySettings.maxFreeSockets === 'number' &&
+      Number.isFinite(proxySettings.maxFreeSockets) &&
+      proxySettings.maxFreeSockets >= 0
+    ) {
+      agentCommonOptions.maxFreeSockets = proxySettings.maxFreeSockets
+    }
+
+    if (
+      typeof proxySettings.timeout === 'number' &&
+      Number.isFinite(proxySettings.timeout) &&
+      proxySettings.timeout > 0
+    ) {
+      agentCommonOptions.timeout = proxySettings.timeout
+    }
+
+    ProxyHelper._agentCommonOptions = Object.freeze(agentCommonOptions)
+    return ProxyHelper._agentCommonOptions
+  }
+
+  /**
+   * 从缓存读取结果，未命中时构建并写入缓存（缓存键为完整配置原文，条目不会过时，不设过期时间，仅按容量淘汰）
+   * @param {LRUCache} cache - 缓存
+   * @param {string} cacheKey - 缓存键
+   * @param {Function} build - 构建结果的函数
+   * @returns {*} 缓存或新构建的结果
+   * @private
+   */
+  static _memoize(cache, cacheKey, build) {
+    const cached = cache.get(cacheKey)
+    if (cached !== undefined) {
+      return cached
+    }
+
+    const value = build()
+    cache.set(cacheKey, value, 0)
+    return value
+  }
+
+  /**
+   * 解析代理配置并提取连接字段
+   * 字符串配置（账户在 Redis 中的存储形式）按原文缓存解析结果，每个请求无需重复 JSON.parse
+   * @param {object|string} proxyConfig - 代理配置对象或 JSON 字符串（以 { 开头但 JSON 无效时抛出异常）
+   * @returns {object|null} 冻结的 { type, host, port, username, password }，缺少必要字段时返回 null
+   * @private
+   */
+  static _validatedFields(proxyConfig) {
+    if (typeof proxyConfig === 'string') {
+      return ProxyHelper._memoize(ProxyHelper._proxyFieldsCache, proxyConfig, () =>
+        // 不是 JSON 对象的字符串不可能包含代理字段，直接判为无效，省去抛出和捕获解析异常
+        proxyConfig.trimStart().startsWith('{')
+          ? ProxyHelper._extractFields(JSON.parse(proxyConfig))
+          : null
+      )
+    }
+    return ProxyHelper._extractFields(proxyConfig)
+  }
+
+  /**
+   * 提取并验证代理连接字段
+   * @param {object} proxy - 已解析的代理配置对象
+   * @returns {object|null} 冻结的代理字段，缺少必要字段时返回 null
+   * @private
+   */
+  static _extractFields(proxy) {
+    if (!proxy) {
+      return null
+    }
+
+    const { type, host, port, username, password } = proxy
+    if (!type || !host || !port) {
+      return null
+    }
+
+    return Object.freeze({ type, host, port, username, password })
+  }
+
+  /**
+   * 拼接代理 URL
+   * @param {object} proxy - 由 _validatedFields 返回的代理字段
+   * @returns {string|null} 代理 URL，类型不受支持时返回 null
+   * @private
+   */
+  static _formatProxyUrl(proxy) {
+    // 构建认证信息（编码用户名和密码，避免 @ : / 等字符破坏 URL 结构）
+    const auth =
+      proxy.username && proxy.password
+        ? `${encodeURIComponent(proxy.username)}:${encodeURIComponent(proxy.password)}@`
+        : ''
+
+    const scheme = PROXY_URL_SCHEMES.get(proxy.type)
+    return scheme ? `${scheme}://${auth}${proxy.host}:${proxy.port}` : null
+  }
+
   /**
    * 获取 IP 协议族偏好设置
    * @param {boolean|number|string} preference - 用户偏好设置
@@ -180,21 +269,17 @@ class ProxyHelper {
     }
 
     try {
-      const proxy = typeof proxyConfig === 'string' ? JSON.parse(proxyConfig) : proxyConfig
-
-      // 检查必要字段
-      if (!proxy.type || !proxy.host || !proxy.port) {
+      // 检查必要字段与支持的类型
+      const proxy = ProxyHelper._validatedFields(proxyConfig)
+      if (!proxy || !PROXY_URL_SCHEMES.has(proxy.type)) {
         return false
       }
 
-      // 检查支持的类型
-      if (!['socks5', 'http', 'https'].includes(proxy.type)) {
-        return false
-      }
+      const { port: rawPort } = proxy
 
-      // 检查端口范围
-      const port = parseInt(proxy.port)
-      if (isNaN(port) || port < 1 || port > 65535) {
+      // 检查端口范围（数字端口无需再解析）
+      const port = Number.isInteger(rawPort) ? rawPort : parseInt(rawPort)
+      if (isNaN(port) || port < PROXY_PORT_MIN || port > PROXY_PORT_MAX) {
         return false
       }
 
@@ -211,18 +296,33 @@ class ProxyHelper {
    */
   static getProxyDescription(proxyConfig) {
     if (!proxyConfig) {
-      return 'No proxy'
+      return NO_PROXY_DESCRIPTION
     }
 
     try {
-      const proxy = typeof proxyConfig === 'string' ? JSON.parse(proxyConfig) : proxyConfig
-      const hasAuth = proxy.username && proxy.password
-      return `${proxy.type}://${proxy.host}:${proxy.port}${hasAuth ? ' (with auth)' : ''}`
+      // 字符串配置按原文缓存描述，每个请求的代理日志无需重复解析
+      if (typeof proxyConfig === 'string') {
+        return ProxyHelper._memoize(ProxyHelper._descriptionCache, proxyConfig, () =>
+          ProxyHelper._formatProxyDescription(JSON.parse(proxyConfig))
+        )
+      }
+      return ProxyHelper._formatProxyDescription(proxyConfig)
     } catch (error) {
-      return 'Invalid proxy config'
+      return INVALID_PROXY_DESCRIPTION
     }
   }
 
+  /**
+   * 拼接代理描述
+   * @param {object} proxy - 已解析的代理配置对象
+   * @returns {string} 代理描述
+   * @private
+   */
+  static _formatProxyDescription(proxy) {
+    const hasAuth = proxy.username && proxy.password
+    return `${proxy.type}://${proxy.host}:${proxy.port}${hasAuth ? ' (with auth)' : ''}`
+  }
+
   /**
    * 脱敏代理配置信息用于日志记录
    * @param {object|string} proxyConfig - 代理配置
@@ -230,30 +330,42 @@ class ProxyHelper {
    */
   static maskProxyInfo(proxyConfig) {
     if (!proxyConfig) {
-      return 'No proxy'
+      return NO_PROXY_DESCRIPTION
     }
 
     try {
-      const proxy = typeof proxyConfig === 'string' ? JSON.parse(proxyConfig) : proxyConfig
-
-      let proxyDesc = `${proxy.type}://${proxy.host}:${proxy.port}`
-
-      // 如果有认证信息，进行脱敏处理
-      if (proxy.username && proxy.password) {
-        const maskedUsername =
-          proxy.username.length <= 2
-            ? proxy.username
-            : proxy.username[0] +
-              '*'.repeat(Math.max(1, proxy.username.length - 2)) +
-              proxy.username.slice(-1)
-        const maskedPassword = '*'.repeat(Math.min(8, proxy.password.length))
-        proxyDesc += ` (auth: ${maskedUsername}:${maskedPassword})`
+      // 字符串配置按原文缓存脱敏结果，同一账户的日志无需重复解析和脱敏
+      if (typeof proxyConfig === 'string') {
+        return ProxyHelper._memoize(ProxyHelper._maskedInfoCache, proxyConfig, () =>
+          ProxyHelper._formatMaskedProxyInfo(JSON.parse(proxyConfig))
+        )
       }
-
-      return proxyDesc
+      return ProxyHelper._formatMaskedProxyInfo(proxyConfig)
     } catch (error) {
-      return 'Invalid proxy config'
+      return INVALID_PROXY_DESCRIPTION
+    }
+  }
+
+  /**
+   * 拼接脱敏后的代理信息
+   * @param {object} proxy - 已解析的代理配置对象
+   * @returns {string} 脱敏后的代理信息
+   * @private
+   */
+  static _formatMaskedProxyInfo(proxy) {
+    const { type, host, port, username, password } = proxy
+
+    // 如果有认证信息，进行脱敏处理
+    if (!username || !password) {
+      return `${type}://${host}:${port}`
     }
+
+    const maskedUsername =
+      username.length <= 2
+        ? username
+        : username[0].padEnd(username.length - 1, '*') + username.slice(-1)
+    const maskedPassword = PASSWORD_MASK.slice(0, password.length)
+    return `${type}://${host}:${port} (auth: ${maskedUsername}:${maskedPassword})`
   }
 
   /**